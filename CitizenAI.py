@@ -8,41 +8,147 @@ Features:
 - Simple keyword-based theme tagging
 - Simple rule-based sentiment scoring
 - Summarize recurring themes and generate short insights
+- Re-score and re-tag all stored feedback after keyword changes (/admin/retag)
 - Stores data in SQLite (persistent file: citizen_ai.db)
 
 Notes:
 - This is a prototype to demonstrate structure and logic. For production use, replace rule-based NLP with
   robust libraries (spaCy, transformers) and add authentication, rate-limiting, input validation, and tests.
-- To run: pip install flask
-  then: python citizen_ai.py
+- To run: pip install flask orjson gunicorn
+  then: python CitizenAI.py   (initializes the DB and serves with gunicorn on port 5000,
+        WORKERS = 2x CPU cores, THREADS = 2 threads each)
+  or:   gunicorn --workers <2x cores> --threads 2 --bind 0.0.0.0:5000 CitizenAI:app   (POST /init once)
+  For development: flask --app CitizenAI run --debug
 
 """
 
-from flask import Flask, request, jsonify, g
+from flask import Flask, Response, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
+import orjson
+import functools
+import os
 import sqlite3
+import queue
 import re
-from collections import Counter, defaultdict
-from datetime import datetime
+import threading
+import time
+from collections import deque
 
 DB_PATH = 'citizen_ai.db'
+POOL_SIZE = 4
+CACHE_SIZE_KIB = 65536  # per-connection page cache
+STATEMENT_CACHE_SIZE = 64
+WRITE_BATCH_SIZE = 100
+BIND = '0.0.0.0:5000'
+# SQLite reads scale across processes; writes serialize in the database anyway
+WORKERS = 2 * (os.cpu_count() or 1)
+THREADS = 2
+INSIGHTS_TTL = 5.0  # seconds; bounds staleness for writes this process did not see
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize request/response JSON with orjson instead of the stdlib encoder"""
+    # keys are sorted to keep the same output as Flask's default provider
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.options), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # ----------------------------
 # Database helpers
 # ----------------------------
 
+# Connections are reused across requests so SQLite's page cache stays warm; they are
+# opened lazily so a forking server never shares one between processes.
+_pool = queue.Queue(maxsize=POOL_SIZE)
+
+# Hot-path statements live in module constants so every execute() passes the same text
+# and hits the connection's prepared-statement cache instead of re-parsing.
+# created_at is spelled out so tables created before the column had a DEFAULT get it too.
+_INSERT_FEEDBACK_SQL = '''INSERT INTO feedback (title, body, category, contact, tags, sentiment, created_at)
+                          VALUES (?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))'''
+_INSERT_TAG_SQL = 'INSERT OR IGNORE INTO feedback_tags (feedback_id, tag) VALUES (?, ?)'
+_UPSERT_THEME_STATS_SQL = '''INSERT INTO theme_stats (theme, count, sent_sum) VALUES (?, 1, ?)
+                             ON CONFLICT(theme) DO UPDATE SET count = count + 1,
+                                                              sent_sum = sent_sum + excluded.sent_sum'''
+# explicit columns, so each row dict carries exactly the fields GET /feedback returns
+_LIST_COLUMNS = 'id, title, body, category, contact, tags, sentiment, created_at'
+_LIST_SQL = f'SELECT {_LIST_COLUMNS} FROM feedback WHERE sentiment >= ? ORDER BY created_at DESC, id DESC'
+_LIST_BY_TAG_SQL = f'''SELECT {_LIST_COLUMNS} FROM feedback WHERE sentiment >= ?
+                      AND id IN (SELECT feedback_id FROM feedback_tags WHERE tag = ?)
+                      ORDER BY created_at DESC, id DESC'''
+
+
+@functools.lru_cache(maxsize=64)
+def _column_names(description):
+    return tuple(d[0] for d in description)
+
+
+def _dict_factory(cursor, row):
+    """Row factory returning plain dicts, so rows can be serialized without copying"""
+    return dict(zip(_column_names(cursor.description), row))
+
+
+def _connect():
+    # autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE where we write
+    db = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                         cached_statements=STATEMENT_CACHE_SIZE)
+    db.row_factory = _dict_factory
+    db.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KIB}')
+    db.execute('PRAGMA synchronous=NORMAL')
+    return db
+
+
+def close_pool():
+    """Close all pooled connections (e.g. before forking worker processes)"""
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+def checkout_db():
+    """Take a connection from the pool (or open one); hand it back with return_db()"""
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+
+def return_db(db):
+    if db.in_transaction:
+        db.rollback()
+    try:
+        _pool.put_nowait(db)
+    except queue.Full:
+        db.close()
+
+
 def get_db():
     db = getattr(g, '_database', None)
     if db is None:
-        db = g._database = sqlite3.connect(DB_PATH)
-        db.row_factory = sqlite3.Row
+        db = g._database = checkout_db()
     return db
 
 
 def init_db():
     db = get_db()
     cursor = db.cursor()
+    # WAL is persistent in the database file; readers no longer block the writer
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('BEGIN IMMEDIATE')
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS feedback (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,24 +158,163 @@ def init_db():
             contact TEXT,
             tags TEXT,
             sentiment REAL,
-            created_at TEXT
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
         )
     ''')
-    db.commit()
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_sent ON feedback(sentiment)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_created ON feedback(created_at)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feedback_tags (
+            feedback_id INTEGER NOT NULL REFERENCES feedback(id),
+            tag TEXT NOT NULL,
+            PRIMARY KEY (feedback_id, tag)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ft_tag ON feedback_tags(tag)')
+    # backfill rows written before feedback_tags existed by splitting their comma-joined tags
+    cursor.execute('''
+        WITH RECURSIVE split(feedback_id, tag, rest) AS (
+            SELECT id, '', COALESCE(NULLIF(tags, ''), 'general') || ',' FROM feedback
+            WHERE id NOT IN (SELECT feedback_id FROM feedback_tags)
+            UNION ALL
+            SELECT feedback_id, substr(rest, 1, instr(rest, ',') - 1), substr(rest, instr(rest, ',') + 1)
+            FROM split WHERE rest <> ''
+        )
+        INSERT OR IGNORE INTO feedback_tags (feedback_id, tag)
+        SELECT feedback_id, tag FROM split WHERE tag <> ''
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS theme_stats (
+            theme TEXT PRIMARY KEY,
+            count INTEGER NOT NULL,
+            sent_sum REAL NOT NULL
+        )
+    ''')
+    rebuild_theme_stats(cursor)
+    cursor.execute('COMMIT')
+    _bump_write_epoch()
+
+
+def rebuild_theme_stats(cursor):
+    """Recompute the per-theme count/sentiment totals that inserts otherwise maintain incrementally"""
+    cursor.execute('DELETE FROM theme_stats')
+    cursor.execute('''
+        INSERT INTO theme_stats (theme, count, sent_sum)
+        SELECT ft.tag, COUNT(*), TOTAL(f.sentiment)
+        FROM feedback_tags ft JOIN feedback f ON f.id = ft.feedback_id
+        GROUP BY ft.tag
+    ''')
 
 
 @app.teardown_appcontext
 def close_connection(exception):
-    db = getattr(g, '_database', None)
+    db = g.pop('_database', None)
     if db is not None:
-        db.close()
+        return_db(db)
+
+# ----------------------------
+# Batched writer
+# ----------------------------
+# Requests hand their row to a single writer thread and wait for it to be committed.
+# The writer drains everything queued so far into one transaction, so concurrent
+# submissions share a single commit (and fsync) instead of paying for one each.
+
+_pending = deque()
+_pending_cond = threading.Condition()
+_writer = None
+# held while writing so bulk jobs (e.g. retag) don't interleave with batched inserts
+_write_lock = threading.Lock()
+# incremented after every commit; cached insights built under an older epoch are stale
+_write_epoch = 0
+
+
+def _bump_write_epoch():
+    global _write_epoch
+    _write_epoch += 1
+
+
+def _writer_loop():
+    db = None
+    while True:
+        with _pending_cond:
+            while not _pending:
+                _pending_cond.wait()
+            batch = [_pending.popleft() for _ in range(min(len(_pending), WRITE_BATCH_SIZE))]
+        # any failure is reported to this batch's waiters; the thread itself must keep running
+        try:
+            if db is None:
+                db = _connect()
+            with _write_lock:
+                cursor = db.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                cursor.executemany(_INSERT_FEEDBACK_SQL, [item['row'] for item in batch])
+                # SQLite's write lock is held for the whole transaction, so the batch got consecutive ids
+                last_id = cursor.execute('SELECT last_insert_rowid() AS id').fetchone()['id']
+                ids = range(last_id - len(batch) + 1, last_id + 1)
+                cursor.executemany(_INSERT_TAG_SQL, [(fid, t) for fid, item in zip(ids, batch) for t in item['tags']])
+                # row[5] is the sentiment column of the queued feedback row
+                cursor.executemany(_UPSERT_THEME_STATS_SQL, [(t, item['row'][5]) for item in batch for t in item['tags']])
+                cursor.execute('COMMIT')
+            _bump_write_epoch()
+            for fid, item in zip(ids, batch):
+                item['id'] = fid
+        except Exception as e:
+            for item in batch:
+                item['error'] = e
+            if db is not None and db.in_transaction:
+                try:
+                    db.rollback()
+                except sqlite3.Error:
+                    # connection is unusable; reconnect for the next batch
+                    db.close()
+                    db = None
+        finally:
+            for item in batch:
+                item['done'].set()
+
+
+def queue_feedback(row, tags):
+    """Queue a feedback row and its tags for insertion and block until they are committed.
+    Returns the new id."""
+    global _writer
+    item = {'row': row, 'tags': tags, 'id': None, 'error': None, 'done': threading.Event()}
+    with _pending_cond:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_writer_loop, name='feedback-writer', daemon=True)
+            _writer.start()
+        _pending.append(item)
+        _pending_cond.notify()
+    item['done'].wait()
+    if item['error'] is not None:
+        raise item['error']
+    return item['id']
+
+# ----------------------------
+# Insights cache
+# ----------------------------
+
+_insights_cache = {}
+
+
+def cached_json(key, build):
+    """Return the serialized result of build() as a JSON response, reusing it until
+    the next write or until INSIGHTS_TTL has passed."""
+    now = time.monotonic()
+    hit = _insights_cache.get(key)
+    if hit is None or hit[0] != _write_epoch or hit[1] < now:
+        epoch = _write_epoch  # read before building so a write during the build invalidates it
+        hit = _insights_cache[key] = (epoch, now + INSIGHTS_TTL, app.json.dumps(build()))
+    return Response(hit[2], mimetype='application/json')
 
 # ----------------------------
 # Simple NLP helpers (rule-based)
 # ----------------------------
 
-POSITIVE_WORDS = set(["good","great","excellent","happy","satisfied","love","like","awesome","fast","helpful","resolved","thank"])
-NEGATIVE_WORDS = set(["bad","poor","terrible","angry","disappointed","hate","slow","delay","delayed","not","issue","problem","complaint","refund","frustrat"])
+POSITIVE_WORDS = set(["good","great","excellent","happy","satisfied","love","like","liked","likes","awesome","fast","faster","helpful","resolved","thank"])
+NEGATIVE_WORDS = set(["bad","badly","poor","poorly","terrible","angry","disappointed","hate","slow","delay","delayed","not","issue","problem","complaint","refund","frustrat"])
+# vocabulary entries that are stems and also match inflected forms (loved, hated, slowly);
+# the rest must match a whole word, so "nothing", "likely" and "goods" don't count
+SENTIMENT_STEMS = set(["love","thank","hate","slow","delay","issue","problem","complaint","refund","frustrat"])
 
 THEME_KEYWORDS = {
     'refunds': ['refund', 'refunds', 'reimbursement'],
@@ -82,35 +327,42 @@ THEME_KEYWORDS = {
 
 WORD_RE = re.compile(r"\w+", re.UNICODE)
 
-
-def tokenize(text):
-    return [w.lower() for w in WORD_RE.findall(text)]
-
-
-def simple_sentiment_score(text):
-    """Return a score between -1 (negative) and +1 (positive)"""
-    tokens = tokenize(text)
-    if not tokens:
-        return 0.0
-    pos = sum(1 for t in tokens if any(t.startswith(p) for p in POSITIVE_WORDS))
-    neg = sum(1 for t in tokens if any(t.startswith(n) for n in NEGATIVE_WORDS))
+# keyword -> themes, inverted once at import. A keyword also maps to the themes of any
+# shorter keyword inside it, so the longest match ("shipment") still credits "ship".
+KW_TO_THEMES = {
+    kw: tuple(theme for theme, kws in THEME_KEYWORDS.items() if any(k in kw for k in kws))
+    for kw in {kw for kws in THEME_KEYWORDS.values() for kw in kws}
+}
+# All keywords, longest first, so a single scan over the text finds every theme hit.
+# Matches must start a word: "shipping" and "roads" count, "township" and "hardship" do not.
+THEME_PATTERN = re.compile(r"\b(?:" + "|".join(
+    re.escape(kw) for kw in sorted(KW_TO_THEMES, key=len, reverse=True)) + ")")
+
+# Whole words are a hash lookup; stems go through a single str.startswith(tuple) call
+EXACT_POS = frozenset(POSITIVE_WORDS - SENTIMENT_STEMS)
+EXACT_NEG = frozenset(NEGATIVE_WORDS - SENTIMENT_STEMS)
+PREFIX_POS = tuple(sorted(POSITIVE_WORDS & SENTIMENT_STEMS))
+PREFIX_NEG = tuple(sorted(NEGATIVE_WORDS & SENTIMENT_STEMS))
+
+
+def analyze(text):
+    """Return (sentiment, tags) for text, scanning its lowercased form only once.
+    Sentiment is a score between -1 (negative) and +1 (positive)"""
+    low = text.lower()
+    pos = neg = 0
+    for m in WORD_RE.finditer(low):
+        t = m.group()
+        if t in EXACT_POS or t.startswith(PREFIX_POS):
+            pos += 1
+        if t in EXACT_NEG or t.startswith(PREFIX_NEG):
+            neg += 1
     score = (pos - neg) / max(1, (pos + neg))
     # normalize to -1..1
     if score > 1: score = 1
     if score < -1: score = -1
-    return round(score, 3)
-
-
-def tag_themes(text):
-    tokens = tokenize(text)
-    tags = set()
-    for theme, kws in THEME_KEYWORDS.items():
-        for kw in kws:
-            if any(kw in t for t in tokens):
-                tags.add(theme)
-                break
+    tags = {theme for m in THEME_PATTERN.finditer(low) for theme in KW_TO_THEMES[m.group()]}
     # fallback: common nouns as tag candidates
-    return list(tags) if tags else ['general']
+    return round(score, 3), (list(tags) if tags else ['general'])
 
 # ----------------------------
 # API Endpoints
@@ -138,17 +390,10 @@ def submit_feedback():
     if not body and not title:
         return jsonify({'error':'title or body required'}), 400
 
-    sentiment = simple_sentiment_score(title + ' ' + body)
-    tags = tag_themes(title + ' ' + body)
-    created_at = datetime.utcnow().isoformat()
+    text = f'{title} {body}'
+    sentiment, tags = analyze(text)
 
-    db = get_db()
-    cursor = db.cursor()
-    cursor.execute('''INSERT INTO feedback (title, body, category, contact, tags, sentiment, created_at)
-                      VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                   (title, body, category, contact, ','.join(tags), sentiment, created_at))
-    db.commit()
-    fid = cursor.lastrowid
+    fid = queue_feedback((title, body, category, contact, ','.join(tags), sentiment), tags)
     return jsonify({'status':'ok','id':fid, 'sentiment':sentiment, 'tags':tags})
 
 
@@ -157,74 +402,105 @@ def list_feedback():
     """List feedback entries with optional filters: ?tag=refunds&min_sent=-0.5"""
     tag = request.args.get('tag')
     min_sent = float(request.args.get('min_sent', '-1'))
-    db = get_db()
-    cursor = db.cursor()
-    rows = cursor.execute('SELECT * FROM feedback ORDER BY created_at DESC').fetchall()
-    out = []
-    for r in rows:
-        tags = r['tags'].split(',') if r['tags'] else []
-        if tag and tag not in tags:
-            continue
-        if r['sentiment'] < min_sent:
-            continue
-        out.append({
-            'id': r['id'], 'title': r['title'], 'body': r['body'], 'category': r['category'],
-            'contact': r['contact'], 'tags': tags, 'sentiment': r['sentiment'], 'created_at': r['created_at']
-        })
-    return jsonify(out)
+    if tag:
+        query, params = _LIST_BY_TAG_SQL, (min_sent, tag)
+    else:
+        query, params = _LIST_SQL, (min_sent,)
+
+    def generate():
+        # emit one row at a time while iterating the cursor instead of building the whole list.
+        # The connection is owned by the generator rather than g: the app context is torn
+        # down before the body is sent, and the cursor must not go back to the pool mid-stream.
+        db = checkout_db()
+        try:
+            yield '['
+            sep = ''
+            for r in db.execute(query, params):
+                r['tags'] = r['tags'].split(',') if r['tags'] else []
+                yield sep + app.json.dumps(r)
+                sep = ','
+            yield ']'
+        finally:
+            return_db(db)
+
+    return Response(generate(), mimetype='application/json')
 
 
 @app.route('/insights/summary', methods=['GET'])
 def summary_insights():
     """Generate a short summary of recurring themes, counts, and average sentiment."""
+    return cached_json('summary', _build_summary)
+
+
+def _build_summary():
     db = get_db()
     cursor = db.cursor()
-    rows = cursor.execute('SELECT * FROM feedback').fetchall()
-    if not rows:
-        return jsonify({'summary':'no data'}), 200
-    tag_counter = Counter()
-    cat_counter = Counter()
-    sentiments = defaultdict(list)
-    for r in rows:
-        tags = r['tags'].split(',') if r['tags'] else ['general']
-        for t in tags:
-            tag_counter[t] += 1
-            sentiments[t].append(r['sentiment'])
-        cat_counter[r['category']] += 1
-
-    top_tags = tag_counter.most_common(6)
-    insights = []
-    for tag, cnt in top_tags:
-        avg_sent = round(sum(sentiments[tag]) / max(1, len(sentiments[tag])),3)
-        insights.append({'theme':tag, 'count':cnt, 'avg_sentiment':avg_sent})
+    total = cursor.execute('SELECT COUNT(*) AS n FROM feedback').fetchone()['n']
+    if not total:
+        return {'summary':'no data'}
+    by_category = cursor.execute(
+        'SELECT category, COUNT(*) AS cnt FROM feedback GROUP BY category ORDER BY cnt DESC').fetchall()
+    top_tags = cursor.execute(
+        'SELECT theme, count, sent_sum / count AS avg_sent FROM theme_stats ORDER BY count DESC, theme LIMIT 6').fetchall()
+    insights = [{'theme':r['theme'], 'count':r['count'], 'avg_sentiment':round(r['avg_sent'],3)} for r in top_tags]
 
     overall = {
-        'total_feedback': sum(cat_counter.values()),
-        'by_category': dict(cat_counter.most_common()),
+        'total_feedback': total,
+        'by_category': {r['category']: r['cnt'] for r in by_category},
         'top_themes': insights
     }
-    return jsonify(overall)
+    return overall
 
 
 @app.route('/insights/actionable', methods=['GET'])
 def actionable_recommendations():
     """Produce simple actionable suggestions based on negative themes."""
+    return cached_json('actionable', _build_recommendations)
+
+
+def _build_recommendations():
     db = get_db()
     cursor = db.cursor()
-    rows = cursor.execute('SELECT * FROM feedback').fetchall()
-    tag_sentiments = defaultdict(list)
-    for r in rows:
-        tags = r['tags'].split(',') if r['tags'] else ['general']
-        for t in tags:
-            tag_sentiments[t].append(r['sentiment'])
+    # most negative themes first
+    rows = cursor.execute('''
+        SELECT theme FROM theme_stats WHERE sent_sum / count < -0.2 ORDER BY sent_sum / count, theme
+    ''').fetchall()
     recs = []
-    for tag, svals in tag_sentiments.items():
-        avg = sum(svals)/max(1,len(svals))
-        if avg < -0.2:
-            recs.append({'theme':tag, 'issue':'negative_sentiment', 'suggestion': f"Investigate {tag} complaints; prioritize root-cause analysis and targeted communication."})
+    for r in rows:
+        tag = r['theme']
+        recs.append({'theme':tag, 'issue':'negative_sentiment', 'suggestion': f"Investigate {tag} complaints; prioritize root-cause analysis and targeted communication."})
     if not recs:
         recs = [{'note':'No strongly negative themes detected. Monitor trends.'}]
-    return jsonify({'recommendations': recs})
+    return {'recommendations': recs}
+
+
+@app.route('/admin/retag', methods=['POST'])
+def admin_retag():
+    """Re-run sentiment scoring and theme tagging over all stored feedback (e.g. after keyword changes)"""
+    db = get_db()
+    cursor = db.cursor()
+    updates = []
+    tag_rows = []
+    for r in cursor.execute('SELECT id, title, body FROM feedback'):
+        fid = r['id']
+        sentiment, tags = analyze(f"{r['title'] or ''} {r['body'] or ''}")
+        updates.append((','.join(tags), sentiment, fid))
+        tag_rows.extend((fid, t) for t in tags)
+    with _write_lock:
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.executemany('UPDATE feedback SET tags = ?, sentiment = ? WHERE id = ?', updates)
+            # only touch rows scored above; feedback submitted meanwhile keeps its tags
+            cursor.executemany('DELETE FROM feedback_tags WHERE feedback_id = ?', [(u[2],) for u in updates])
+            cursor.executemany(_INSERT_TAG_SQL, tag_rows)
+            rebuild_theme_stats(cursor)
+            cursor.execute('COMMIT')
+        except sqlite3.Error:
+            if db.in_transaction:
+                db.rollback()
+            raise
+        _bump_write_epoch()
+    return jsonify({'status':'ok','retagged':len(updates)})
 
 
 # ----------------------------
@@ -240,7 +516,26 @@ def home():
     '''
 
 if __name__ == '__main__':
+    from gunicorn.app.base import BaseApplication
+
+    class StandaloneApplication(BaseApplication):
+        """Serve the app with gunicorn from this script instead of the single-threaded dev server"""
+
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
     # Initialize DB on first run
     with app.app_context():
         init_db()
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # workers open their own connections (and writer thread) after the fork
+    close_pool()
+    StandaloneApplication(app, {'bind': BIND, 'workers': WORKERS, 'threads': THREADS}).run()